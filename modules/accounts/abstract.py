@@ -17,6 +17,8 @@ class Account(ABC):
         _login (Protegido/Interno): Realiza o login na conta.
         _check_session_exists (Protegido/Interno): Verifica uma sessão existe.
     """
+    __slots__ = ('username', 'password', 'platform_id')
+
     def __init__(self,
                  username: str='',
                  password: str='',
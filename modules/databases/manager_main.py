@@ -3,7 +3,7 @@
 import sqlite3
 
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from modules.accounts.abstract import Account
 
@@ -14,6 +14,7 @@ class ManagerMain:
         self.main_db_dir = Path(__file__).parent
         self.main_database = self.main_db_dir / 'main.sqlite3'
         self.__should_update_schema = False
+        self._supported_platforms: Optional[Tuple[sqlite3.Row, ...]] = None
         if not self.main_database.exists():
             self.__should_update_schema = True
         self._main_conn = sqlite3.connect(self.main_database)
@@ -22,37 +23,38 @@ class ManagerMain:
         if self.__should_update_schema:
             self.__update_schema()
 
+    def __execute_sql_script(self, script_name: str) -> None:
+        """Executa um arquivo .sql do diretório do banco de dados."""
+        sql_commands = (self.main_db_dir / script_name).read_text(encoding='utf-8')
+        self._main_conn.executescript(sql_commands)
+        self._main_conn.commit()
+
     def __update_schema(self) -> None:
         """Atualiza o schema do banco de dados, pelo mais atual."""
-        cursor = self._main_conn.cursor()
-        with open(self.main_db_dir / 'main.sql', 'r', encoding='utf-8') as sql_file:
-            sql_commands = sql_file.read()
-            cursor.executescript(sql_commands)
-        self._main_conn.commit()
-        cursor.close()
+        self.__execute_sql_script('main.sql')
         print('[DATABASE] Schema prncipal do banco de dados atualizado com sucesso.')
         self.__update_supported_platforms()
 
     def __update_supported_platforms(self) -> None:
         """Atualiza as plataformas suportadas pelo programa."""
-        cursor = self._main_conn.cursor()
-        with open(self.main_db_dir / 'supported_platforms.sql', 'r', encoding='utf-8') as sql_file:
-            sql_commands = sql_file.read()
-            cursor.executescript(sql_commands)
-        self._main_conn.commit()
-        cursor.close()
-        total = self._main_conn.execute('SELECT count(name) SELECT Platforms').fetchone()[0]
+        self.__execute_sql_script('supported_platforms.sql')
+        self._supported_platforms = None
+        total = self._main_conn.execute('SELECT count(name) FROM Platforms').fetchone()[0]
         print(f'[DATABASE] {total} Plataformas suportadas atualizadas com sucesso.')
 
     def get_supported_platforms(self) -> Tuple[sqlite3.Row, ...]:
-        """Retorna as plataformas suportadas pelo programa."""
-        cursor = self._main_conn.cursor()
-        cursor.execute('SELECT * from Platforms')
-        platforms = cursor.fetchall()
-        cursor.close()
-        return platforms
+        """Retorna as plataformas suportadas pelo programa.
+
+        A tabela só muda quando as plataformas suportadas são atualizadas,
+        então o resultado fica em memória até a próxima atualização."""
+        if self._supported_platforms is None:
+            cursor = self._main_conn.cursor()
+            cursor.execute('SELECT * from Platforms')
+            self._supported_platforms = tuple(cursor.fetchall())
+            cursor.close()
+        return self._supported_platforms
 
-    def insert_new_account(self, new_account: Account=Account('Invalida', '123', 1)) -> Account:
+    def insert_new_account(self, new_account: Account) -> Account:
         """Insere uma nova conta no banco de dados."""
         cursor = self._main_conn.cursor()
         cursor.execute('INSERT OR IGNORE INTO Accounts (username, password, platform_id) values (?, ?, ?)',